@@ -1,19 +1,71 @@
+import ast
+import codecs
+import re
+from functools import lru_cache
+from pathlib import Path
+
+DEFAULT_SOURCE_PATH = Path(__file__).resolve().parent.parent / "tasks" / "start_tasks.py"
+
+# top-level (column 0) function definitions whose name ends in _phase
+PHASE_DEF_PATTERN = re.compile(rb'^(?:async[ \t]+)?def[ \t]+([A-Za-z_]\w*_phase)[ \t]*\(', re.MULTILINE)
+
 #needed as a workaround since python executes imported files
 #This presents a problem since importing the phase functions themselves needs information from the config
 #while the config needs the phase names before population
 #The solution is to either make the user define the phase names seperate or to do this
 #Which is to import the .py as text and parse the function names.
-def get_phase_names_without_import():
-    raw_file = open("augur/tasks/start_tasks.py")
-    lines = raw_file.readlines()
-    raw_file.close()
+def get_phase_names_without_import(source_path=None, strict=False):
+    """
+    Read the phase function names out of start_tasks.py without importing it.
+
+    Phase functions are required to be defined at module level, so only
+    ``def``/``async def`` statements starting in column 0 are considered;
+    nested and indented definitions are ignored.
+
+    The default mode is a textual regex scan, so it can differ from
+    ``strict=True``: it also matches a column-0 ``def ..._phase(`` inside a
+    multi-line string and misses a definition split across lines.
+
+    Results are memoized for the life of the process and invalidated when the
+    file's modification time or size changes.
+
+    Args:
+        source_path: Optional path to the file to scan. Defaults to the
+            start_tasks.py shipped with this augur install, independent of
+            the current working directory.
+        strict: If True, parse the file with ast instead of scanning it with a
+            regex, so a file that is not valid Python raises SyntaxError.
+
+    Returns:
+        List of function names ending in ``_phase``, in file order.
+    """
+    if source_path is None:
+        source_path = DEFAULT_SOURCE_PATH
+    else:
+        source_path = Path(source_path).resolve()
+
+    stat_result = source_path.stat()
+
+    return list(_cached_phase_names(str(source_path), stat_result.st_mtime_ns, stat_result.st_size, strict))
+
+
+@lru_cache(maxsize=32)
+def _cached_phase_names(path_str, mtime_ns, size, strict):
+    # mtime_ns and size are only part of the cache key so edits to the file invalidate it;
+    # size catches same-tick edits on filesystems with coarse timestamps
+    source_bytes = Path(path_str).read_bytes()
 
-    phase_names = []
+    if not strict:
+        # a leading UTF-8 BOM would otherwise hide a def on the first line
+        source_bytes = source_bytes.removeprefix(codecs.BOM_UTF8)
+        return tuple(name.decode("ascii") for name in PHASE_DEF_PATTERN.findall(source_bytes))
 
-    for line in lines:
-        if "def " in line and "_phase(" in line:
-            without_def = line.split()[1]
-            phase_names.append(without_def.split('(')[0])
-    
+    # same as ast.parse, minus the wrapper and without inheriting __future__ flags;
+    # compile decodes the bytes itself, honouring a BOM or coding cookie
+    tree = compile(source_bytes, path_str, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
 
-    return phase_names
\ No newline at end of file
+    # only top-level statements can be phase functions
+    return tuple(
+        node.name for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.endswith("_phase")
+    )
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: MIT
+"""Unit tests for reading phase names without importing start_tasks.py"""
+
+import os
+
+import pytest
+
+from augur.util.inspect_without_import import get_phase_names_without_import
+
+
+def write_source(tmp_path, source, name="tasks.py"):
+    path = tmp_path / name
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+class TestGetPhaseNamesWithoutImport:
+    """Tests for get_phase_names_without_import function"""
+
+    def test_default_start_tasks(self):
+        """Test that the shipped start_tasks.py yields the current phase list"""
+        assert get_phase_names_without_import() == [
+            "prelim_phase",
+            "primary_repo_collect_phase",
+            "secondary_repo_collect_phase",
+        ]
+
+    def test_default_independent_of_cwd(self, tmp_path, monkeypatch):
+        """Test that the default lookup works outside the repository root"""
+        monkeypatch.chdir(tmp_path)
+
+        assert get_phase_names_without_import() == [
+            "prelim_phase",
+            "primary_repo_collect_phase",
+            "secondary_repo_collect_phase",
+        ]
+
+    def test_async_def(self, tmp_path):
+        """Test that top-level async defs are picked up in both modes"""
+        path = write_source(tmp_path, "def a_phase():\n    pass\n\nasync def b_phase ():\n    pass\n")
+
+        assert get_phase_names_without_import(path) == ["a_phase", "b_phase"]
+        assert get_phase_names_without_import(path, strict=True) == ["a_phase", "b_phase"]
+
+    def test_nested_defs_skipped(self, tmp_path):
+        """Test that indented and class-nested phase defs are ignored"""
+        source = (
+            "def a_phase():\n"
+            "    def inner_phase():\n"
+            "        pass\n"
+            "\n"
+            "class Phases:\n"
+            "    def method_phase(self):\n"
+            "        pass\n"
+            "\n"
+            "    async def async_method_phase(self):\n"
+            "        pass\n"
+            "\n"
+            "def helper():\n"
+            "    pass\n"
+        )
+        path = write_source(tmp_path, source)
+
+        assert get_phase_names_without_import(path) == ["a_phase"]
+        assert get_phase_names_without_import(path, strict=True) == ["a_phase"]
+
+    def test_leading_bom(self, tmp_path):
+        """Test that a UTF-8 BOM does not hide a phase on the first line"""
+        path = tmp_path / "tasks.py"
+        path.write_bytes(b"\xef\xbb\xbfdef a_phase():\n    pass\n\ndef b_phase():\n    pass\n")
+
+        assert get_phase_names_without_import(path) == ["a_phase", "b_phase"]
+        assert get_phase_names_without_import(path, strict=True) == ["a_phase", "b_phase"]
+
+    def test_cache_invalidated_on_edit(self, tmp_path):
+        """Test that editing the file invalidates the memoized result"""
+        path = write_source(tmp_path, "def a_phase():\n    pass\n")
+
+        assert get_phase_names_without_import(path) == ["a_phase"]
+
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("def a_phase():\n    pass\n\ndef new_phase():\n    pass\n", encoding="utf-8")
+        os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        assert get_phase_names_without_import(path) == ["a_phase", "new_phase"]
+
+    def test_result_is_a_copy(self, tmp_path):
+        """Test that mutating a returned list does not affect later calls"""
+        path = write_source(tmp_path, "def a_phase():\n    pass\n")
+
+        phase_names = get_phase_names_without_import(path)
+        phase_names.append("bogus_phase")
+
+        assert get_phase_names_without_import(path) == ["a_phase"]
+
+    def test_strict_raises_syntax_error(self, tmp_path):
+        """Test that strict mode raises SyntaxError on invalid source"""
+        path = write_source(tmp_path, "def a_phase(:\n    pass\n")
+
+        with pytest.raises(SyntaxError):
+            get_phase_names_without_import(path, strict=True)